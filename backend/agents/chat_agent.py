@@ -4,7 +4,7 @@ Provides intelligent answers based on database analysis and web research
 """
 from agents.base_agent import BaseAgent
 from tools.sql_db import SQLDatabaseTool
-from tools.vector_db import ChromaSearchTool
+from tools.vector_db import get_vector_tool
 import google.generativeai as genai
 from config import Config
 import json
@@ -15,7 +15,7 @@ class ChatAgent(BaseAgent):
     
     def __init__(self):
         self.db_tool = SQLDatabaseTool()
-        self.vector_tool = ChromaSearchTool()
+        self.vector_tool = get_vector_tool()
         
         # Configure Gemini API - Use lazy initialization to avoid startup errors
         self.gemini_api_key = Config.GEMINI_API_KEY if Config.GEMINI_API_KEY else None
@@ -26,7 +26,7 @@ class GhostwriterAgent(BaseAgent):
         Generate a tailored bio for a specific client industry
         Returns markdown-formatted bio
         """
-        employee = self.db_tool.get_employee(emp_id)
+        employee = self.db_tool.get_employee_with_project_history(emp_id)
         if not employee:
             return "Employee not found"
         
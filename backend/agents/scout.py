@@ -3,13 +3,13 @@ The Scout Agent - Semantic Search Engine
 Discovers employees matching job descriptions
 """
 from agents.base_agent import BaseAgent
-from tools.vector_db import ChromaSearchTool
+from tools.vector_db import get_vector_tool
 
 class ScoutAgent(BaseAgent):
     """The Scout - Discovery Agent"""
     
     def __init__(self):
-        self.vector_tool = ChromaSearchTool()
+        self.vector_tool = get_vector_tool()
         super().__init__(
             role="Talent Scout",
             goal="Find the best matching employees for job descriptions using semantic search",
@@ -22,6 +22,8 @@ class Config:
         str(Path(__file__).parent.parent / 'data' / 'chroma_store')
     )
     CHROMA_COLLECTION_NAME = 'consultant_vectors'
+    # Set CHROMA_SEED=0 to seed only the SQL database (no embedding calls)
+    CHROMA_SEED = os.getenv('CHROMA_SEED', '1') == '1'
     
     # Google Gemini API (for embeddings and LLM)
     GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
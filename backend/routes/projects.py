@@ -4,7 +4,7 @@ Project Management Routes
 """
 from flask import Blueprint, request, jsonify
 from tools.sql_db import SQLDatabaseTool
-from tools.vector_db import ChromaSearchTool
+from tools.vector_db import get_vector_tool
 from models import Project, ProjectStatus, ProjectType, ProjectRoleRequirements, Allocation, Employee, AllocationFinancial
 from datetime import datetime, date
 from utils.allocation_validator import validate_allocation_percentage
@@ -12,7 +12,7 @@ from agents.team_suggestion_agent import TeamSuggestionAgent
 
 bp = Blueprint('projects', __name__)
 db_tool = SQLDatabaseTool()
-vector_tool = ChromaSearchTool()
+vector_tool = get_vector_tool()
 # Initialize agent lazily to avoid startup errors
 _team_suggestion_agent = None
 
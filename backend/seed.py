@@ -3,11 +3,17 @@ Seed script to populate database with dummy data and ChromaDB embeddings
 Generates 20 employees and 5 projects as per specification
 """
 import sys
+import csv
+import io
 from pathlib import Path
 from datetime import date, timedelta
 import random
+from collections import defaultdict
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert, select, func, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 
 # Load environment variables from .env file
@@ -27,23 +33,26 @@ from tools.vector_db import ChromaSearchTool
 from tools.sql_db import SQLDatabaseTool
 
 # Sample data - Indian subcontinent names
-FIRST_NAMES = ["Rajesh", "Priya", "Amit", "Kavita", "Rahul", "Anjali", "Vikram", "Sneha", "Arjun", "Divya",
-               "Suresh", "Meera", "Karan", "Pooja", "Rohan", "Neha", "Aditya", "Shreya", "Nikhil", "Ananya"]
+FIRST_NAMES = ("Rajesh", "Priya", "Amit", "Kavita", "Rahul", "Anjali", "Vikram", "Sneha", "Arjun", "Divya",
+               "Suresh", "Meera", "Karan", "Pooja", "Rohan", "Neha", "Aditya", "Shreya", "Nikhil", "Ananya")
 
-LAST_NAMES = ["Kumar", "Sharma", "Patel", "Singh", "Reddy", "Gupta", "Verma", "Mehta", "Jain", "Agarwal",
-              "Malhotra", "Kapoor", "Chopra", "Bansal", "Shah", "Joshi", "Desai", "Iyer", "Nair", "Rao"]
+LAST_NAMES = ("Kumar", "Sharma", "Patel", "Singh", "Reddy", "Gupta", "Verma", "Mehta", "Jain", "Agarwal",
+              "Malhotra", "Kapoor", "Chopra", "Bansal", "Shah", "Joshi", "Desai", "Iyer", "Nair", "Rao")
 
-SKILLS = ["Python", "Java", "JavaScript", "React", "Node.js", "AWS", "Azure", "Docker", "Kubernetes", "SQL",
+SKILLS = ("Python", "Java", "JavaScript", "React", "Node.js", "AWS", "Azure", "Docker", "Kubernetes", "SQL",
           "MongoDB", "PostgreSQL", "Machine Learning", "Data Science", "DevOps", "CI/CD", "Agile", "Scrum",
           "Microservices", "REST API", "GraphQL", "TypeScript", "Angular", "Vue.js", "Spring Boot", "Django",
-          "Flask", "FastAPI", "TensorFlow", "PyTorch"]
+          "Flask", "FastAPI", "TensorFlow", "PyTorch")
 
-LOCATIONS = ["Bangalore", "Hyderabad", "Pune", "Mumbai", "Chennai", "Delhi", "Gurgaon", "Noida", "Kolkata", "Ahmedabad"]
+# Lowercased once for tech-stack matching against project descriptions
+SKILLS_LOWER = [(skill, skill.lower()) for skill in SKILLS]
 
-CLIENTS = ["HDFC Bank", "ICICI Bank", "Reliance Industries", "Tata Consultancy Services", "Infosys", "Wipro", "Tech Mahindra", 
-          "Axis Bank", "State Bank of India", "Bharti Airtel", "Adani Group", "Mahindra & Mahindra", "L&T", "HCL Technologies"]
+LOCATIONS = ("Bangalore", "Hyderabad", "Pune", "Mumbai", "Chennai", "Delhi", "Gurgaon", "Noida", "Kolkata", "Ahmedabad")
 
-PROJECT_DESCRIPTIONS = [
+CLIENTS = ("HDFC Bank", "ICICI Bank", "Reliance Industries", "Tata Consultancy Services", "Infosys", "Wipro", "Tech Mahindra", 
+          "Axis Bank", "State Bank of India", "Bharti Airtel", "Adani Group", "Mahindra & Mahindra", "L&T", "HCL Technologies")
+
+PROJECT_DESCRIPTIONS = (
     "Senior Python developer needed for digital banking platform. Experience with microservices, AWS, and real-time payment processing using UPI/NEFT/RTGS required. Knowledge of Indian banking regulations and compliance standards essential.",
     "Full-stack JavaScript developer for e-commerce platform targeting Indian market. React, Node.js, and MongoDB expertise essential. Experience with payment gateways like Razorpay, Paytm integration preferred.",
     "Cloud architect for enterprise migration to Azure. Kubernetes and containerization experience required. Experience with Indian data localization requirements and compliance standards.",
@@ -54,7 +63,7 @@ PROJECT_DESCRIPTIONS = [
     "Retail technology specialist for omnichannel retail platform. Experience with Indian retail market, inventory management, and supply chain systems essential.",
     "FinTech specialist for digital lending platform. Experience with NBFC regulations, credit scoring, and loan management systems required.",
     "Education technology expert for online learning platform. Experience with Indian education system, curriculum management, and student assessment tools required."
-]
+)
 
 # Domain data
 DOMAINS = [
@@ -67,55 +76,287 @@ DOMAINS = [
     {"name": "E-commerce", "code": "ECOMMERCE", "type": DomainType.BUSINESS_DOMAIN},
 ]
 
+# Enum members used for random draws, materialized once
+ROLE_LEVELS = tuple(RoleLevel)
+PROJECT_TYPES = tuple(ProjectType)
+DOMAIN_PRIORITIES = tuple(DomainPriority)
+RATE_NEGOTIATION_STATUSES = tuple(RateNegotiationStatus)
+RISK_TYPES = tuple(RiskType)
+RISK_SEVERITIES = tuple(RiskSeverity)
+RISK_STATUSES = tuple(RiskStatus)
+
+# Fixed choice pools, built once instead of per row
+PROJECT_STATUSES = (ProjectStatus.PIPELINE, ProjectStatus.ACTIVE, ProjectStatus.ON_HOLD, ProjectStatus.CLOSED)
+INDUSTRY_DOMAINS = ("FinTech", "Healthcare", "Retail", "Manufacturing", "Telecom", "Education", "Other")
+BILLING_CURRENCIES = ("INR", "USD")  # Primarily INR for Indian market
+ROLE_NAMES = ("Architect", "Project Manager", "Senior Developer", "Developer",
+              "Business Analyst", "QA Engineer", "Tech Lead", "Designer")
+VISA_STATUSES = ("Indian Citizen", "OCI", "Work Visa", "H1B")
+SEED_EMPLOYEE_STATUSES = (EmployeeStatus.BENCH, EmployeeStatus.ALLOCATED)
+ALLOCATION_PERCENTAGES = (50, 80, 100, 100, 100)  # Bias towards 100%
+FEEDBACK_TAGS = ("Delivery", "Innovation", "Communication", "Technical Excellence", "Leadership", "Problem Solving")
+RISK_ISSUES = ("Notice period risk", "Skill gap identified", "Performance concerns", "Critical role dependency")
+RISK_MITIGATIONS = ("Cross-training", "Backup resource", "Performance improvement plan", "Knowledge transfer")
+
+# Priority score thresholds (ascending) and the tier for each band between them
+PRIORITY_TIER_THRESHOLDS = (50, 100, 150)
+PRIORITY_TIERS = (PriorityTier.LOW, PriorityTier.MEDIUM, PriorityTier.HIGH, PriorityTier.CRITICAL)
+
+# Bio wording per role level
+LEVEL_DESC = {
+    RoleLevel.JR: "junior",
+    RoleLevel.MID: "mid-level",
+    RoleLevel.SR: "senior",
+    RoleLevel.LEAD: "lead",
+    RoleLevel.PRINCIPAL: "principal"
+}
+
+# Base monthly CTC per role level (Indian market rates in INR)
+CTC_BASE = {
+    RoleLevel.JR: 40000,      # ~$500/month in INR
+    RoleLevel.MID: 80000,      # ~$1000/month in INR
+    RoleLevel.SR: 150000,     # ~$1800/month in INR
+    RoleLevel.LEAD: 250000,   # ~$3000/month in INR
+    RoleLevel.PRINCIPAL: 400000  # ~$4800/month in INR
+}
+
+# Fixed bio text around the skills list, built once per role level
+BIO_PREFIXES = {level: f"{desc} software engineer with expertise in " for level, desc in LEVEL_DESC.items()}
+BIO_DEFAULT_PREFIX = "experienced software engineer with expertise in "
+BIO_SUFFIX = (
+    ". Strong background in software development and system architecture. "
+    "Proven track record of delivering high-quality solutions in agile environments."
+)
+
 def generate_bio(role_level, skills_list):
     """Generate a realistic bio summary"""
-    level_desc = {
-        RoleLevel.JR: "junior",
-        RoleLevel.MID: "mid-level",
-        RoleLevel.SR: "senior",
-        RoleLevel.LEAD: "lead",
-        RoleLevel.PRINCIPAL: "principal"
-    }
+    return "".join((BIO_PREFIXES.get(role_level, BIO_DEFAULT_PREFIX), ", ".join(skills_list[:3]), BIO_SUFFIX))
+
+def extract_tech_stack(description):
+    """Comma-separated list of the first 5 known skills mentioned in a project description"""
+    description_lower = description.lower()
+    tech_stack_list = [skill for skill, skill_lower in SKILLS_LOWER if skill_lower in description_lower]
+    return ", ".join(tech_stack_list[:5]) if tech_stack_list else "Python, JavaScript"
+
+# PROJECT_DESCRIPTIONS is fixed, so each description's tech stack is extracted once at import
+TECH_STACK_BY_DESCRIPTION = {description: extract_tech_stack(description) for description in PROJECT_DESCRIPTIONS}
+
+# Industry domain rules, checked in order: (client substrings, description keywords, domain)
+INDUSTRY_RULES = (
+    (("Bank", "Finance"), ("fintech",), "FinTech"),
+    (("Health",), ("healthcare",), "Healthcare"),
+    (("Retail",), ("e-commerce",), "Retail"),
+    (("Airtel",), ("telecom",), "Telecom"),
+)
+
+def match_industry_domain(client, description):
+    """Industry domain of the first rule matching the client name or description, else None"""
+    description_lower = description.lower()
+    for client_needles, description_needles, domain in INDUSTRY_RULES:
+        if any(needle in client for needle in client_needles) or any(needle in description_lower for needle in description_needles):
+            return domain
+    return None
+
+# Connection settings for bulk loading a SQLite database: the seed is a one-shot
+# rebuild, so it trades crash durability for speed (seed connections only)
+SQLITE_BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA cache_size=-262144",  # 256 MB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=30000000000",
+)
+
+# Rows per executemany batch for bulk inserts
+BULK_INSERT_BATCH_SIZE = 10000
+
+def dbapi_rows(dialect, table, rows):
+    """
+    Convert row dicts into DBAPI-ready tuples for direct cursor writes.
+    Client-side column defaults are filled in and values go through the column
+    types' bind processors, so enums are written the same way INSERT writes them.
+    Returns the target columns and the tuples.
+    """
+    columns = [c for c in table.columns if c.key in rows[0] or c.default is not None]
+    processors = [c.type.bind_processor(dialect) for c in columns]
+    
+    values = []
+    for row in rows:
+        row_values = []
+        for column, process in zip(columns, processors):
+            if column.key in row:
+                value = row[column.key]
+            elif column.default.is_callable:
+                value = column.default.arg(None)
+            else:
+                value = column.default.arg
+            row_values.append(process(value) if process else value)
+        values.append(tuple(row_values))
+    return columns, values
+
+def copy_insert(session, model, rows):
+    """Stream rows into a PostgreSQL table with COPY FROM STDIN (psycopg2 only)"""
+    if not rows:
+        return
+    dialect = session.get_bind().dialect
+    preparer = dialect.identifier_preparer
+    table = model.__table__
+    columns, values = dbapi_rows(dialect, table, rows)
+    
+    buf = io.StringIO()
+    csv.writer(buf).writerows(values)
+    buf.seek(0)
     
-    bio = f"{level_desc.get(role_level, 'experienced')} software engineer with expertise in {', '.join(skills_list[:3])}. "
-    bio += f"Strong background in software development and system architecture. "
-    bio += f"Proven track record of delivering high-quality solutions in agile environments."
+    column_list = ", ".join(preparer.quote(c.name) for c in columns)
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {preparer.format_table(table)} ({column_list}) FROM STDIN WITH CSV", buf)
+    finally:
+        cursor.close()
+
+def raw_insert(session, model, rows):
+    """
+    Insert rows with a single DBAPI cursor executemany, skipping SQLAlchemy's
+    statement handling entirely. Used for the largest seed table; falls back to
+    bulk_insert() for psycopg2 (which uses COPY) and unsupported paramstyles.
+    """
+    if not rows:
+        return
+    dialect = session.get_bind().dialect
+    placeholder = {"qmark": "?", "format": "%s", "pyformat": "%s"}.get(dialect.paramstyle)
+    if placeholder is None or dialect.driver == "psycopg2":
+        bulk_insert(session, model, rows)
+        return
+    preparer = dialect.identifier_preparer
+    table = model.__table__
+    columns, values = dbapi_rows(dialect, table, rows)
     
-    return bio
+    column_list = ", ".join(preparer.quote(c.name) for c in columns)
+    placeholders = ", ".join([placeholder] * len(columns))
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.executemany(f"INSERT INTO {preparer.format_table(table)} ({column_list}) VALUES ({placeholders})", values)
+    finally:
+        cursor.close()
+
+def bulk_insert(session, model, rows, batch_size=BULK_INSERT_BATCH_SIZE):
+    """Insert rows with executemany, at most batch_size rows per statement"""
+    if session.get_bind().dialect.driver == "psycopg2":
+        copy_insert(session, model, rows)
+        return
+    for start in range(0, len(rows), batch_size):
+        session.execute(insert(model), rows[start:start + batch_size])
+
+def bulk_insert_returning(session, model, rows, returning, batch_size=BULK_INSERT_BATCH_SIZE):
+    """Insert rows in batches with RETURNING, giving results back in row order"""
+    results = []
+    for start in range(0, len(rows), batch_size):
+        results.extend(session.scalars(
+            insert(model).returning(returning, sort_by_parameter_order=True),
+            rows[start:start + batch_size]
+        ).all())
+    return results
+
+def build_allocation_financials(pending, total_hours=160):
+    """
+    Compute AllocationFinancial rows for a batch of allocations in a single pass.
+    Each pending entry carries the allocation id, rate card, billing rate, CTC,
+    allocation/billable/internal percentages and trainee flag.
+    """
+    rows = []
+    for entry in pending:
+        is_trainee = entry["is_trainee"]
+        billing_rate = 0 if is_trainee else (entry["billing_rate"] or 0)
+        # Revenue is based on allocation_percentage, cost on internal_allocation_percentage
+        billed_hours = 0 if is_trainee else int((total_hours * entry["allocation_pct"] * entry["billable_pct"]) / 10000)
+        cost_hours = int((total_hours * entry["internal_pct"]) / 100)
+        estimated_revenue = billing_rate * billed_hours
+        cost_rate = entry["ctc_monthly"] / 160.0
+        estimated_cost = cost_rate * cost_hours
+        gross_margin = ((estimated_revenue - estimated_cost) / estimated_revenue * 100) if estimated_revenue > 0 else 0
+        
+        rows.append({
+            "allocation_id": entry["allocation_id"],
+            "rate_card_id": entry["rate_card_id"],  # Always use rate card (base rate for cost calculation)
+            "billing_rate": billing_rate,
+            "cost_rate": round(cost_rate, 2),
+            "gross_margin_percentage": round(gross_margin, 2),
+            "estimated_revenue": round(estimated_revenue, 2),
+            "estimated_cost": round(estimated_cost, 2),
+            "billed_hours": billed_hours,
+            "utilized_hours": cost_hours,  # Use cost_hours (based on internal allocation)
+            "total_hours_in_period": total_hours
+        })
+    return rows
+
+def embed_changed_bios(vector_tool, emp_ids, bios):
+    """
+    Embed the bios that differ from what ChromaDB already stores. Nothing is
+    written to ChromaDB here; the caller upserts the result after the SQL commit.
+    """
+    emp_ids, bios = vector_tool.get_changed_bios(emp_ids, bios)
+    return emp_ids, bios, vector_tool.get_embeddings(bios)
 
 def seed_database():
     """Main seeding function"""
     print("Initializing database...")
+    today = date.today()
     
     # Initialize database
-    engine = create_engine(Config.SQLALCHEMY_DATABASE_URI)
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
+    engine_options = {"insertmanyvalues_page_size": BULK_INSERT_BATCH_SIZE}
+    driver = make_url(Config.SQLALCHEMY_DATABASE_URI).get_driver_name()
+    if driver == "psycopg2":
+        # Batch the executemany calls insertmanyvalues doesn't cover (e.g. flushed UPDATEs)
+        engine_options.update(executemany_mode="values_plus_batch", executemany_batch_page_size=500)
+    elif driver == "pyodbc":
+        engine_options["fast_executemany"] = True
+    engine = create_engine(Config.SQLALCHEMY_DATABASE_URI, **engine_options)
+    if engine.dialect.name == "sqlite":
+        @event.listens_for(engine, "connect")
+        def set_bulk_load_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for pragma in SQLITE_BULK_LOAD_PRAGMAS:
+                cursor.execute(pragma)
+            cursor.close()
+    # Check out a single connection for schema creation and the whole seed
+    connection = engine.connect()
+    Base.metadata.create_all(connection)
+    connection.commit()
+    # One transaction for the whole seed with no implicit flushes; the final
+    # commit doesn't expire the objects still referenced by the summary
+    Session = sessionmaker(bind=connection, autoflush=False, expire_on_commit=False)
     session = Session()
+    if engine.dialect.name == "postgresql":
+        # Don't wait on the WAL flush at commit; scoped to the seed transaction only
+        session.execute(text("SET LOCAL synchronous_commit = OFF"))
     
-    # Initialize ChromaDB
-    print("Initializing ChromaDB...")
-    vector_tool = ChromaSearchTool()
+    # Initialize ChromaDB (skipped entirely when CHROMA_SEED=0)
+    vector_tool = None
+    if Config.CHROMA_SEED:
+        print("Initializing ChromaDB...")
+        vector_tool = ChromaSearchTool()
+    # Embedding is network-bound and independent of the SQL phases, so it runs
+    # in the background while the rest of the database is seeded
+    embedding_executor = ThreadPoolExecutor(max_workers=1)
     
     try:
         # Create 20 employees
         print("Creating employees...")
-        employees = []
-        used_emails = set()  # Track used emails to ensure uniqueness
+        employee_rows = []
+        skills_per_employee = []
+        bios = []
+        name_counts = defaultdict(int)  # Emails already issued per name, for unique suffixes
         
         for i in range(20):
             first_name = random.choice(FIRST_NAMES)
             last_name = random.choice(LAST_NAMES)
-            role_level = random.choice(list(RoleLevel))
+            role_level = random.choice(ROLE_LEVELS)
             
-            # Generate unique email
-            base_email = f"{first_name.lower()}.{last_name.lower()}@benchcraft.ai"
-            email = base_email
-            counter = 1
-            while email in used_emails:
-                email = f"{first_name.lower()}.{last_name.lower()}{counter}@benchcraft.ai"
-                counter += 1
-            used_emails.add(email)
+            # Generate unique email: repeat names get a numeric suffix (1, 2, ...)
+            name_key = (first_name.lower(), last_name.lower())
+            suffix = name_counts[name_key] or ""
+            name_counts[name_key] += 1
+            email = f"{name_key[0]}.{name_key[1]}{suffix}@benchcraft.ai"
             
             # Assign skills (3-7 skills per employee)
             num_skills = random.randint(3, 7)
@@ -125,188 +366,198 @@ def seed_database():
             bio = generate_bio(role_level, employee_skills)
             
             # Calculate CTC based on role level (Indian market rates in INR)
-            ctc_base = {
-                RoleLevel.JR: 40000,      # ~$500/month in INR
-                RoleLevel.MID: 80000,      # ~$1000/month in INR
-                RoleLevel.SR: 150000,     # ~$1800/month in INR
-                RoleLevel.LEAD: 250000,   # ~$3000/month in INR
-                RoleLevel.PRINCIPAL: 400000  # ~$4800/month in INR
+            ctc_monthly = CTC_BASE[role_level] + random.randint(-10000, 50000)
+            
+            employee_rows.append({
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,  # Use unique email
+                "role_level": role_level.value,  # Store enum value as string
+                "ctc_monthly": ctc_monthly,
+                "currency": "INR",  # Indian Rupees
+                "base_location": random.choice(LOCATIONS),
+                "visa_status": random.choice(VISA_STATUSES),
+                "remote_pref": random.choice((True, False)),
+                "status": random.choice(SEED_EMPLOYEE_STATUSES),
+                "joined_date": today - timedelta(days=random.randint(30, 1000)),
+                "bio_summary": bio
+            })
+            skills_per_employee.append(employee_skills)
+            bios.append(bio)
+        
+        # Insert all employees in batches; RETURNING hands back the persistent objects with IDs
+        employees = bulk_insert_returning(session, Employee, employee_rows, Employee)
+        # Progress lines are printed with one write per phase rather than one per row
+        print("\n".join(
+            f"  Created employee {i}/{len(employee_rows)}: {row['first_name']} {row['last_name']} ({row['role_level']})"
+            for i, row in enumerate(employee_rows, 1)
+        ))
+        
+        # Add skills for all employees in one executemany
+        skill_rows = [
+            {
+                "emp_id": employee.id,
+                "skill_name": skill_name,
+                "proficiency": random.randint(2, 5),
+                "last_used": today - timedelta(days=random.randint(0, 365)),
+                "is_verified": random.choice((True, False))
             }
-            ctc_monthly = ctc_base[role_level] + random.randint(-10000, 50000)
-            
-            employee = Employee(
-                first_name=first_name,
-                last_name=last_name,
-                email=email,  # Use unique email
-                role_level=role_level.value,  # Store enum value as string
-                ctc_monthly=ctc_monthly,
-                currency="INR",  # Indian Rupees
-                base_location=random.choice(LOCATIONS),
-                visa_status=random.choice(["Indian Citizen", "OCI", "Work Visa", "H1B"]),
-                remote_pref=random.choice([True, False]),
-                status=random.choice([EmployeeStatus.BENCH, EmployeeStatus.ALLOCATED]),
-                joined_date=date.today() - timedelta(days=random.randint(30, 1000)),
-                bio_summary=bio
+            for employee, employee_skills in zip(employees, skills_per_employee)
+            for skill_name in employee_skills
+        ]
+        bulk_insert(session, EmployeeSkill, skill_rows)
+        
+        # Embed all bios in batched calls; the ChromaDB write waits for the SQL commit
+        embedding_future = None
+        if vector_tool:
+            print("\nGenerating ChromaDB embeddings...")
+            embedding_future = embedding_executor.submit(
+                embed_changed_bios, vector_tool, [e.id for e in employees], bios
             )
-            
-            session.add(employee)
-            session.flush()  # Get the ID
-            
-            # Add skills
-            for skill_name in employee_skills:
-                skill = EmployeeSkill(
-                    emp_id=employee.id,
-                    skill_name=skill_name,
-                    proficiency=random.randint(2, 5),
-                    last_used=date.today() - timedelta(days=random.randint(0, 365)),
-                    is_verified=random.choice([True, False])
-                )
-                session.add(skill)
-            
-            # Add to ChromaDB
-            vector_tool.add_employee_embedding(employee.id, bio)
-            
-            employees.append(employee)
-            print(f"  Created employee {i+1}/20: {first_name} {last_name} ({role_level.value})")
         
         # Create domains
         print("\nCreating domains...")
-        domains = []
-        for domain_data in DOMAINS:
-            domain = Domain(
-                domain_name=domain_data["name"],
-                domain_code=domain_data["code"],
-                domain_type=domain_data["type"],
-                description=f"{domain_data['name']} domain expertise",
-                is_active=True
-            )
-            session.add(domain)
-            session.flush()
-            domains.append(domain)
-            print(f"  Created domain: {domain_data['name']}")
+        domains = bulk_insert_returning(
+            session,
+            Domain,
+            [
+                {
+                    "domain_name": domain_data["name"],
+                    "domain_code": domain_data["code"],
+                    "domain_type": domain_data["type"],
+                    "description": f"{domain_data['name']} domain expertise",
+                    "is_active": True
+                }
+                for domain_data in DOMAINS
+            ],
+            Domain
+        )
+        print("\n".join(f"  Created domain: {domain.domain_name}" for domain in domains))
         
         # Create 5 projects
         print("\nCreating projects...")
-        projects = []
-        industry_domains = ["FinTech", "Healthcare", "Retail", "Manufacturing", "Telecom", "Education", "Other"]
-        project_types = list(ProjectType)
-        currencies = ["INR", "USD"]  # Primarily INR for Indian market
-        statuses = [ProjectStatus.PIPELINE, ProjectStatus.ACTIVE, ProjectStatus.ON_HOLD, ProjectStatus.CLOSED]
+        project_rows = []
+        num_projects = 5
+        # First 2 projects get a random win probability, the rest are certain
+        probabilities = [random.randint(50, 100) for _ in range(2)] + [100] * (num_projects - 2)
         
-        for i in range(5):
+        for i in range(num_projects):
             client = random.choice(CLIENTS)
             description = random.choice(PROJECT_DESCRIPTIONS)
             
-            # Extract tech stack from description
-            tech_stack_list = []
-            for skill in SKILLS:
-                if skill.lower() in description.lower():
-                    tech_stack_list.append(skill)
-            tech_stack = ", ".join(tech_stack_list[:5]) if tech_stack_list else "Python, JavaScript"
+            tech_stack = TECH_STACK_BY_DESCRIPTION[description]
             
-            # Select random industry domain based on client/project type
-            industry_domain = random.choice(industry_domains)
-            # Match industry domain to client if possible
-            if "Bank" in client or "Finance" in client or "FinTech" in description:
-                industry_domain = "FinTech"
-            elif "Health" in client or "Healthcare" in description:
-                industry_domain = "Healthcare"
-            elif "Retail" in client or "e-commerce" in description.lower():
-                industry_domain = "Retail"
-            elif "Airtel" in client or "Telecom" in description:
-                industry_domain = "Telecom"
+            # Match industry domain to client if possible, otherwise pick a random one
+            industry_domain = match_industry_domain(client, description) or random.choice(INDUSTRY_DOMAINS)
             
             # Budget in INR (Indian market)
             budget_cap = random.randint(5000000, 20000000)  # 50L to 2Cr INR
             
-            project = Project(
-                client_name=client,
-                project_name=f"{client} Digital Platform",
-                description=description,
-                budget_cap=budget_cap,
-                billing_currency=random.choice(currencies),  # Primarily INR
-                project_type=random.choice(project_types),
-                industry_domain=industry_domain,
-                start_date=date.today() + timedelta(days=random.randint(-30, 30)),
-                end_date=date.today() + timedelta(days=random.randint(90, 365)),
-                status=random.choice(statuses),
-                probability=random.randint(50, 100) if i < 2 else 100,
-                tech_stack=tech_stack
-            )
-            
-            session.add(project)
-            session.flush()  # Flush to get the project.id
-            
-            # Generate project_code: PROJ-<Year>-<PrimaryKey>
-            current_year = date.today().year
+            project_rows.append({
+                "client_name": client,
+                "project_name": f"{client} Digital Platform",
+                "description": description,
+                "budget_cap": budget_cap,
+                "billing_currency": random.choice(BILLING_CURRENCIES),  # Primarily INR
+                "project_type": random.choice(PROJECT_TYPES),
+                "industry_domain": industry_domain,
+                "start_date": today + timedelta(days=random.randint(-30, 30)),
+                "end_date": today + timedelta(days=random.randint(90, 365)),
+                "status": random.choice(PROJECT_STATUSES),
+                "probability": probabilities[i],
+                "tech_stack": tech_stack
+            })
+        
+        projects = bulk_insert_returning(session, Project, project_rows, Project)
+        
+        # Generate project_code: PROJ-<Year>-<PrimaryKey>
+        current_year = today.year
+        for project in projects:
             project.project_code = f"PROJ-{current_year}-{project.id}"
-            
-            projects.append(project)
-            print(f"  Created project {i+1}/5: {client} Platform (Code: {project.project_code})")
+        print("\n".join(
+            f"  Created project {i}/{num_projects}: {project.client_name} Platform (Code: {project.project_code})"
+            for i, project in enumerate(projects, 1)
+        ))
         
         # Create employee domains (assign 1-3 domains per employee)
         print("\nCreating employee domains...")
+        employee_domain_rows = []
         for employee in employees:
             num_domains = random.randint(1, 3)
             employee_domains_list = random.sample(domains, min(num_domains, len(domains)))
             
             for idx, domain in enumerate(employee_domains_list):
-                emp_domain = EmployeeDomain(
-                    emp_id=employee.id,
-                    domain_id=domain.id,
-                    proficiency=random.randint(3, 5),
-                    years_of_experience=random.uniform(1.0, 8.0),
-                    first_exposure_date=date.today() - timedelta(days=random.randint(100, 2000)),
-                    last_used_date=date.today() - timedelta(days=random.randint(0, 180)),
-                    is_primary_domain=(idx == 0)  # First domain is primary
-                )
-                session.add(emp_domain)
+                employee_domain_rows.append({
+                    "emp_id": employee.id,
+                    "domain_id": domain.id,
+                    "proficiency": random.randint(3, 5),
+                    "years_of_experience": random.uniform(1.0, 8.0),
+                    "first_exposure_date": today - timedelta(days=random.randint(100, 2000)),
+                    "last_used_date": today - timedelta(days=random.randint(0, 180)),
+                    "is_primary_domain": (idx == 0)  # First domain is primary
+                })
+        bulk_insert(session, EmployeeDomain, employee_domain_rows)
+        employee_domain_ids_by_emp = defaultdict(list)
+        for row in employee_domain_rows:
+            employee_domain_ids_by_emp[row["emp_id"]].append(row["domain_id"])
         
         # Create rate cards for employees
         print("\nCreating rate cards...")
-        rate_cards_map = {}  # Map employee_id to rate_card_id
+        base_rates = []
         for employee in employees:
             # Calculate base hourly rate (typically 2-3x hourly cost for 50% margin)
             hourly_cost = employee.ctc_monthly / 160.0  # Assuming 160 working hours/month
-            base_rate = hourly_cost * random.uniform(2.0, 3.0)  # 50-66% margin
-            
-            # Create base rate card (in INR)
-            base_rate_card = RateCard(
-                emp_id=employee.id,
-                domain_id=None,  # Base rate
-                hourly_rate=round(base_rate, 2),
-                currency="INR",  # Indian Rupees
-                effective_date=date.today() - timedelta(days=30),
-                expiry_date=None,
-                rate_type=RateType.BASE,
-                is_active=True
-            )
-            session.add(base_rate_card)
-            session.flush()
-            rate_cards_map[employee.id] = base_rate_card.id
-            
+            base_rates.append(hourly_cost * random.uniform(2.0, 3.0))  # 50-66% margin
+        
+        # Create base rate cards (in INR) in bulk, returning their IDs
+        base_rate_card_ids = bulk_insert_returning(
+            session,
+            RateCard,
+            [
+                {
+                    "emp_id": employee.id,
+                    "domain_id": None,  # Base rate
+                    "hourly_rate": round(base_rate, 2),
+                    "currency": "INR",  # Indian Rupees
+                    "effective_date": today - timedelta(days=30),
+                    "expiry_date": None,
+                    "rate_type": RateType.BASE,
+                    "is_active": True
+                }
+                for employee, base_rate in zip(employees, base_rates)
+            ],
+            RateCard.id
+        )
+        rate_cards_map = {employee.id: rate_card_id for employee, rate_card_id in zip(employees, base_rate_card_ids)}  # Map employee_id to rate_card_id
+        hourly_rate_by_card = {rate_card_id: round(base_rate, 2) for rate_card_id, base_rate in zip(base_rate_card_ids, base_rates)}
+        
+        domain_rate_card_rows = []
+        for employee, base_rate in zip(employees, base_rates):
             # Create 1-2 domain-specific rate cards (higher rates in INR)
-            employee_domains = session.query(EmployeeDomain).filter(EmployeeDomain.emp_id == employee.id).all()
-            if employee_domains:
-                selected_domains = random.sample(employee_domains, min(2, len(employee_domains)))
-                for emp_domain in selected_domains:
+            employee_domain_ids = employee_domain_ids_by_emp[employee.id]
+            if employee_domain_ids:
+                selected_domain_ids = random.sample(employee_domain_ids, min(2, len(employee_domain_ids)))
+                for domain_id in selected_domain_ids:
                     domain_rate = base_rate * random.uniform(1.1, 1.5)  # 10-50% premium
-                    domain_rate_card = RateCard(
-                        emp_id=employee.id,
-                        domain_id=emp_domain.domain_id,
-                        hourly_rate=round(domain_rate, 2),
-                        currency="INR",  # Indian Rupees
-                        effective_date=date.today() - timedelta(days=20),
-                        expiry_date=None,
-                        rate_type=RateType.DOMAIN_SPECIFIC,
-                        is_active=True
-                    )
-                    session.add(domain_rate_card)
+                    domain_rate_card_rows.append({
+                        "emp_id": employee.id,
+                        "domain_id": domain_id,
+                        "hourly_rate": round(domain_rate, 2),
+                        "currency": "INR",  # Indian Rupees
+                        "effective_date": today - timedelta(days=20),
+                        "expiry_date": None,
+                        "rate_type": RateType.DOMAIN_SPECIFIC,
+                        "is_active": True
+                    })
+        bulk_insert(session, RateCard, domain_rate_card_rows)
         
         # Create allocations (assign some employees to projects)
         print("\nCreating allocations...")
         active_projects = [p for p in projects if p.status == ProjectStatus.ACTIVE]
-        allocated_employees = []
+        allocated_employees = set()
+        allocation_rows = []
+        primary_emp_ids_by_proj = defaultdict(list)  # Non-trainee allocations, for mentor lookup
+        pending_financials = []
         
         for project in active_projects[:3]:  # Allocate to first 3 active projects
             num_allocations = random.randint(2, 5)
@@ -326,14 +577,13 @@ def seed_database():
                 alloc_end = project.end_date - timedelta(days=random.randint(0, 30)) if project.end_date else None
                 
                 # Get rate from rate card
-                rate_card = session.query(RateCard).filter(RateCard.id == rate_card_id).first()
-                billing_rate = rate_card.hourly_rate if rate_card else None
+                billing_rate = hourly_rate_by_card.get(rate_card_id)
                 
                 # Create allocation with allocation_percentage and billable_percentage
                 # Most allocations are 100% allocation and 100% billable
                 # Some scenarios: partial allocation, or allocation > billable (replacement scenario)
-                allocation_pct = random.choice([50, 80, 100, 100, 100])  # Bias towards 100%
-                billable_pct = random.choice([50, 80, 100, 100, 100])  # Bias towards 100%
+                allocation_pct = random.choice(ALLOCATION_PERCENTAGES)
+                billable_pct = random.choice(ALLOCATION_PERCENTAGES)
                 
                 # Special case: if allocation is 100% but billable is 50%, simulate replacement scenario
                 if allocation_pct == 100 and random.random() < 0.1:  # 10% chance
@@ -357,14 +607,12 @@ def seed_database():
                 # If trainee, find a primary resource on the same project to shadow
                 if is_trainee:
                     # Find existing primary allocations on this project
-                    primary_allocations = session.query(Allocation).filter(
-                        Allocation.proj_id == project.id,
-                        Allocation.is_trainee == False,
-                        Allocation.emp_id != employee.id
-                    ).all()
+                    primary_emp_ids = [
+                        emp_id for emp_id in primary_emp_ids_by_proj[project.id] if emp_id != employee.id
+                    ]
                     
-                    if primary_allocations:
-                        mentoring_primary_emp_id = random.choice(primary_allocations).emp_id
+                    if primary_emp_ids:
+                        mentoring_primary_emp_id = random.choice(primary_emp_ids)
                         # Trainees are never billable
                         billable_pct = 0
                         allocation_pct = 0  # Not reported to client
@@ -375,84 +623,76 @@ def seed_database():
                         # No primary resource available, make this a regular allocation
                         is_trainee = False
                 
-                allocation = Allocation(
-                    emp_id=employee.id,
-                    proj_id=project.id,
-                    start_date=alloc_start,
-                    end_date=alloc_end,
-                    billing_rate=billing_rate if not is_trainee else 0,
-                    is_revealed=random.choice([True, False]) if not is_trainee else False,
-                    allocation_percentage=allocation_pct,
-                    billable_percentage=billable_pct,
-                    internal_allocation_percentage=internal_pct,
-                    is_trainee=is_trainee,
-                    mentoring_primary_emp_id=mentoring_primary_emp_id,
-                    rate_card_id=rate_card_id  # Use base rate card even for trainees (for cost calculation)
-                )
-                session.add(allocation)
-                session.flush()  # Flush to get allocation.id
+                allocation_rows.append({
+                    "emp_id": employee.id,
+                    "proj_id": project.id,
+                    "start_date": alloc_start,
+                    "end_date": alloc_end,
+                    "billing_rate": billing_rate if not is_trainee else 0,
+                    "is_revealed": random.choice((True, False)) if not is_trainee else False,
+                    "allocation_percentage": allocation_pct,
+                    "billable_percentage": billable_pct,
+                    "internal_allocation_percentage": internal_pct,
+                    "is_trainee": is_trainee,
+                    "mentoring_primary_emp_id": mentoring_primary_emp_id,
+                    "rate_card_id": rate_card_id  # Use base rate card even for trainees (for cost calculation)
+                })
+                if not is_trainee:
+                    primary_emp_ids_by_proj[project.id].append(employee.id)
                 
-                # Create AllocationFinancial for each allocation
+                # Queue AllocationFinancial inputs; the allocation id is filled in after the batch insert
                 if (billing_rate and rate_card_id) or is_trainee:
-                    # Calculate financial metrics using new formulas
-                    total_hours = 160  # Monthly hours
-                    
-                    if is_trainee:
-                        # Trainees: no revenue, cost based on internal allocation
-                        billed_hours = 0
-                        cost_hours = int((total_hours * internal_pct) / 100)
-                        estimated_revenue = 0.0
-                    else:
-                        # Primary resources: revenue based on allocation_percentage, cost based on internal_allocation_percentage
-                        billed_hours = int((total_hours * allocation_pct * billable_pct) / 10000)
-                        cost_hours = int((total_hours * internal_pct) / 100)
-                        estimated_revenue = billing_rate * billed_hours if billing_rate else 0.0
-                    
-                    cost_rate = employee.ctc_monthly / 160.0
-                    estimated_cost = cost_rate * cost_hours
-                    gross_margin = ((estimated_revenue - estimated_cost) / estimated_revenue * 100) if estimated_revenue > 0 else 0
-                    
-                    alloc_financial = AllocationFinancial(
-                        allocation_id=allocation.id,
-                        rate_card_id=rate_card_id,  # Always use rate card (base rate for cost calculation)
-                        billing_rate=billing_rate if not is_trainee else 0,
-                        cost_rate=round(cost_rate, 2),
-                        gross_margin_percentage=round(gross_margin, 2),
-                        estimated_revenue=round(estimated_revenue, 2),
-                        estimated_cost=round(estimated_cost, 2),
-                        billed_hours=billed_hours,
-                        utilized_hours=cost_hours,  # Use cost_hours (based on internal allocation)
-                        total_hours_in_period=total_hours
-                    )
-                    session.add(alloc_financial)
+                    pending_financials.append({
+                        "allocation_index": len(allocation_rows) - 1,
+                        "rate_card_id": rate_card_id,
+                        "billing_rate": billing_rate,
+                        "ctc_monthly": employee.ctc_monthly,
+                        "allocation_pct": allocation_pct,
+                        "billable_pct": billable_pct,
+                        "internal_pct": internal_pct,
+                        "is_trainee": is_trainee
+                    })
                 
                 # Update employee status
                 employee.status = EmployeeStatus.ALLOCATED
-                allocated_employees.append(employee.id)
+                allocated_employees.add(employee.id)
+        
+        allocation_ids = bulk_insert_returning(session, Allocation, allocation_rows, Allocation.id)
+        allocated_emp_ids_by_proj = defaultdict(list)
+        for row in allocation_rows:
+            allocated_emp_ids_by_proj[row["proj_id"]].append(row["emp_id"])
+        for entry in pending_financials:
+            entry["allocation_id"] = allocation_ids[entry["allocation_index"]]
+        
+        # Create AllocationFinancial for each allocation
+        bulk_insert(session, AllocationFinancial, build_allocation_financials(pending_financials))
         
         # Create project domains (assign 1-2 domains per project)
         print("\nCreating project domains...")
+        project_domain_rows = []
         for project in projects:
             num_domains = random.randint(1, 2)
             project_domains_list = random.sample(domains, min(num_domains, len(domains)))
             
             for domain in project_domains_list:
-                proj_domain = ProjectDomain(
-                    proj_id=project.id,
-                    domain_id=domain.id,
-                    priority=random.choice(list(DomainPriority)),
-                    weight=random.randint(5, 10),
-                    requirements=f"Requires expertise in {domain.domain_name} domain"
-                )
-                session.add(proj_domain)
+                project_domain_rows.append({
+                    "proj_id": project.id,
+                    "domain_id": domain.id,
+                    "priority": random.choice(DOMAIN_PRIORITIES),
+                    "weight": random.randint(5, 10),
+                    "requirements": f"Requires expertise in {domain.domain_name} domain"
+                })
+        bulk_insert(session, ProjectDomain, project_domain_rows)
+        project_domain_ids_by_proj = defaultdict(list)
+        for row in project_domain_rows:
+            project_domain_ids_by_proj[row["proj_id"]].append(row["domain_id"])
         
         # Create project role requirements (for some projects)
         print("\nCreating project role requirements...")
-        role_names = ["Architect", "Project Manager", "Senior Developer", "Developer", 
-                     "Business Analyst", "QA Engineer", "Tech Lead", "Designer"]
+        role_requirement_rows = []
         for project in projects[:3]:  # Add role requirements to first 3 projects
             num_roles = random.randint(2, 4)
-            selected_roles = random.sample(role_names, min(num_roles, len(role_names)))
+            selected_roles = random.sample(ROLE_NAMES, min(num_roles, len(ROLE_NAMES)))
             
             for role_name in selected_roles:
                 # Use role defaults
@@ -468,180 +708,177 @@ def seed_database():
                 }
                 defaults = role_defaults.get(role_name, {"utilization": 100, "max": 100})
                 
-                role_req = ProjectRoleRequirements(
-                    proj_id=project.id,
-                    role_name=role_name,
-                    required_count=random.randint(1, 3),
-                    utilization_percentage=defaults["utilization"]
-                )
-                session.add(role_req)
+                role_requirement_rows.append({
+                    "proj_id": project.id,
+                    "role_name": role_name,
+                    "required_count": random.randint(1, 3),
+                    "utilization_percentage": defaults["utilization"]
+                })
+        bulk_insert(session, ProjectRoleRequirements, role_requirement_rows)
         
         # Create project rate requirements
         print("\nCreating project rate requirements...")
+        # Average active rate per domain, aggregated once in SQL
+        avg_rates_by_domain = dict(session.execute(
+            select(RateCard.domain_id, func.avg(RateCard.hourly_rate))
+            .where(RateCard.is_active == True)
+            .group_by(RateCard.domain_id)
+        ).all())
+        domain_names_by_id = {domain.id: domain.domain_name for domain in domains}
+        rate_requirement_rows = []
         for project in projects[:2]:  # Add rate requirements to first 2 projects
             # Select 1-2 domains for rate requirements
-            project_domains = session.query(ProjectDomain).filter(ProjectDomain.proj_id == project.id).all()
-            if project_domains:
-                selected_domains = random.sample(project_domains, min(2, len(project_domains)))
-                for proj_domain in selected_domains:
+            project_domain_ids = project_domain_ids_by_proj[project.id]
+            if project_domain_ids:
+                selected_domain_ids = random.sample(project_domain_ids, min(2, len(project_domain_ids)))
+                for domain_id in selected_domain_ids:
                     # Get average rate for this domain
-                    domain_rates = session.query(RateCard).filter(
-                        RateCard.domain_id == proj_domain.domain_id,
-                        RateCard.is_active == True
-                    ).all()
-                    if domain_rates:
-                        avg_rate = sum([r.hourly_rate for r in domain_rates]) / len(domain_rates)
+                    avg_rate = avg_rates_by_domain.get(domain_id)
+                    if avg_rate is not None:
                         # Get domain name
-                        domain_obj = session.query(Domain).filter(Domain.id == proj_domain.domain_id).first()
-                        domain_name = domain_obj.domain_name if domain_obj else "Unknown"
-                        rate_req = ProjectRateRequirements(
-                            proj_id=project.id,
-                            domain_id=proj_domain.domain_id,
-                            min_acceptable_rate=round(avg_rate * 0.8, 2),
-                            max_acceptable_rate=round(avg_rate * 1.2, 2),
-                            preferred_rate=round(avg_rate, 2),
-                            rate_negotiation_status=random.choice(list(RateNegotiationStatus)),
-                            rate_notes=f"Rate requirements for {domain_name} domain"
-                        )
-                        session.add(rate_req)
+                        domain_name = domain_names_by_id.get(domain_id, "Unknown")
+                        rate_requirement_rows.append({
+                            "proj_id": project.id,
+                            "domain_id": domain_id,
+                            "min_acceptable_rate": round(avg_rate * 0.8, 2),
+                            "max_acceptable_rate": round(avg_rate * 1.2, 2),
+                            "preferred_rate": round(avg_rate, 2),
+                            "rate_negotiation_status": random.choice(RATE_NEGOTIATION_STATUSES),
+                            "rate_notes": f"Rate requirements for {domain_name} domain"
+                        })
+        bulk_insert(session, ProjectRateRequirements, rate_requirement_rows)
         
         # Create feedback entries
         print("\nCreating feedback entries...")
-        feedback_tags = ["Delivery", "Innovation", "Communication", "Technical Excellence", "Leadership", "Problem Solving"]
+        feedback_rows = []
         for project in active_projects[:2] if active_projects else []:  # Add feedback for first 2 active projects
-            project_allocations = session.query(Allocation).filter(Allocation.proj_id == project.id).all()
-            if project_allocations:
+            project_emp_ids = allocated_emp_ids_by_proj[project.id]
+            if project_emp_ids:
                 # Create 1-2 feedback entries per project
                 num_feedbacks = random.randint(1, 2)
-                selected_allocations = random.sample(project_allocations, min(num_feedbacks, len(project_allocations)))
+                selected_emp_ids = random.sample(project_emp_ids, min(num_feedbacks, len(project_emp_ids)))
                 
-                for allocation in selected_allocations:
-                    feedback = Feedback360(
-                        emp_id=allocation.emp_id,
-                        proj_id=project.id,
-                        rating=random.randint(3, 5),
-                        feedback=f"Strong performance on {project.project_name}. Demonstrated excellent technical skills and collaboration.",
-                        tags=", ".join(random.sample(feedback_tags, random.randint(2, 4)))
-                    )
-                    session.add(feedback)
+                for emp_id in selected_emp_ids:
+                    feedback_rows.append({
+                        "emp_id": emp_id,
+                        "proj_id": project.id,
+                        "rating": random.randint(3, 5),
+                        "feedback": f"Strong performance on {project.project_name}. Demonstrated excellent technical skills and collaboration.",
+                        "tags": ", ".join(random.sample(FEEDBACK_TAGS, random.randint(2, 4)))
+                    })
+        bulk_insert(session, Feedback360, feedback_rows)
         
         # Create bench ledger entries
         print("\nCreating bench ledger entries...")
+        # Latest allocation end date per employee, aggregated once in SQL
+        last_allocation_end_by_emp = dict(session.execute(
+            select(Allocation.emp_id, func.max(Allocation.end_date))
+            .group_by(Allocation.emp_id)
+        ).all())
         bench_employees = [e for e in employees if e.status == EmployeeStatus.BENCH]
+        bench_rows = []
         for employee in bench_employees[:5]:  # Create bench entries for first 5 bench employees
-            # Check if employee has previous allocation
-            last_allocation = session.query(Allocation).filter(
-                Allocation.emp_id == employee.id
-            ).order_by(Allocation.end_date.desc()).first()
-            
-            if last_allocation and last_allocation.end_date:
-                bench_start = last_allocation.end_date
-                bench_end = None  # Ongoing bench
-                days_on_bench = (date.today() - bench_start).days
-            else:
-                bench_start = date.today() - timedelta(days=random.randint(1, 60))
-                bench_end = None
-                days_on_bench = (date.today() - bench_start).days
-            
-            cost_per_day = employee.ctc_monthly / 30.0
-            cost_incurred = cost_per_day * days_on_bench
-            
-            bench_entry = BenchLedger(
-                emp_id=employee.id,
-                start_date=bench_start,
-                end_date=bench_end,
-                reason="Project End",
-                cost_incurred=round(cost_incurred, 2)
-            )
-            session.add(bench_entry)
+            # Bench starts when the previous allocation ended, or at a random recent date
+            bench_start = last_allocation_end_by_emp.get(employee.id) or today - timedelta(days=random.randint(1, 60))
+            days_on_bench = (today - bench_start).days
+            
+            bench_rows.append({
+                "emp_id": employee.id,
+                "start_date": bench_start,
+                "end_date": None,  # Ongoing bench
+                "reason": "Project End",
+                "cost_incurred": round(employee.ctc_monthly * days_on_bench / 30.0, 2)
+            })
+        bulk_insert(session, BenchLedger, bench_rows)
         
         # Create financial metrics (in INR)
         print("\nCreating financial metrics...")
         # Company-wide metrics
-        company_metrics = FinancialMetrics(
-            emp_id=None,
-            proj_id=None,
-            target_gross_margin_percentage=50.0,
-            actual_gross_margin_percentage=random.uniform(45.0, 55.0),
-            total_revenue=random.uniform(50000000, 200000000),  # 5Cr to 20Cr INR
-            total_cost=random.uniform(25000000, 100000000),  # 2.5Cr to 10Cr INR
-            gross_profit=0.0,  # Will be calculated
-            period_start_date=date.today().replace(day=1),
-            period_end_date=date.today(),
-            period_type=PeriodType.MONTHLY
-        )
-        company_metrics.gross_profit = company_metrics.total_revenue - company_metrics.total_cost
-        session.add(company_metrics)
+        total_revenue = random.uniform(50000000, 200000000)  # 5Cr to 20Cr INR
+        total_cost = random.uniform(25000000, 100000000)  # 2.5Cr to 10Cr INR
+        metrics_rows = [{
+            "emp_id": None,
+            "proj_id": None,
+            "target_gross_margin_percentage": 50.0,
+            "actual_gross_margin_percentage": random.uniform(45.0, 55.0),
+            "total_revenue": total_revenue,
+            "total_cost": total_cost,
+            "gross_profit": total_revenue - total_cost,
+            "period_start_date": today.replace(day=1),
+            "period_end_date": today,
+            "period_type": PeriodType.MONTHLY
+        }]
         
         # Project-specific metrics (in INR)
         for project in active_projects[:2] if active_projects else []:
-            project_metrics = FinancialMetrics(
-                emp_id=None,
-                proj_id=project.id,
-                target_gross_margin_percentage=50.0,
-                actual_gross_margin_percentage=random.uniform(40.0, 60.0),
-                total_revenue=random.uniform(5000000, 20000000),  # 50L to 2Cr INR
-                total_cost=random.uniform(2500000, 10000000),  # 25L to 1Cr INR
-                gross_profit=0.0,
-                period_start_date=project.start_date,
-                period_end_date=date.today(),
-                period_type=PeriodType.PROJECT_LIFETIME
-            )
-            project_metrics.gross_profit = project_metrics.total_revenue - project_metrics.total_cost
-            session.add(project_metrics)
+            total_revenue = random.uniform(5000000, 20000000)  # 50L to 2Cr INR
+            total_cost = random.uniform(2500000, 10000000)  # 25L to 1Cr INR
+            metrics_rows.append({
+                "emp_id": None,
+                "proj_id": project.id,
+                "target_gross_margin_percentage": 50.0,
+                "actual_gross_margin_percentage": random.uniform(40.0, 60.0),
+                "total_revenue": total_revenue,
+                "total_cost": total_cost,
+                "gross_profit": total_revenue - total_cost,
+                "period_start_date": project.start_date,
+                "period_end_date": today,
+                "period_type": PeriodType.PROJECT_LIFETIME
+            })
+        bulk_insert(session, FinancialMetrics, metrics_rows)
         
         # Create risk register entries
         print("\nCreating risk register entries...")
-        risk_types = list(RiskType)
-        risk_severities = list(RiskSeverity)
-        risk_statuses = list(RiskStatus)
-        
         # Create risks for some employees
-        for employee in employees[:5]:  # First 5 employees
+        risk_rows = []
+        active_project_ids = [p.id for p in active_projects]
+        employee_ids = [e.id for e in employees]
+        for index, employee in enumerate(employees[:5]):  # First 5 employees
             if random.random() < 0.3:  # 30% chance of having a risk
-                risk = RiskRegister(
-                    emp_id=employee.id,
-                    project_id=random.choice([p.id for p in active_projects]) if active_projects and random.random() < 0.7 else None,
-                    risk_type=random.choice(risk_types),
-                    severity=random.choice(risk_severities),
-                    description=f"Risk identified for {employee.first_name} {employee.last_name}: {random.choice(['Notice period risk', 'Skill gap identified', 'Performance concerns', 'Critical role dependency'])}",
-                    mitigation_plan=f"Mitigation plan: {random.choice(['Cross-training', 'Backup resource', 'Performance improvement plan', 'Knowledge transfer'])}",
-                    mitigation_owner_emp_id=random.choice([e.id for e in employees if e.id != employee.id]) if len(employees) > 1 else None,
-                    identified_date=date.today() - timedelta(days=random.randint(1, 30)),
-                    target_resolution_date=date.today() + timedelta(days=random.randint(30, 90)),
-                    status=random.choice(risk_statuses)
-                )
-                session.add(risk)
+                # Mitigation owner: any other employee, picked by skipping over this one's index
+                owner_index = random.randrange(len(employee_ids) - 1) if len(employee_ids) > 1 else None
+                if owner_index is not None and owner_index >= index:
+                    owner_index += 1
+                risk_rows.append({
+                    "emp_id": employee.id,
+                    "project_id": random.choice(active_project_ids) if active_project_ids and random.random() < 0.7 else None,
+                    "risk_type": random.choice(RISK_TYPES),
+                    "severity": random.choice(RISK_SEVERITIES),
+                    "description": f"Risk identified for {employee.first_name} {employee.last_name}: {random.choice(RISK_ISSUES)}",
+                    "mitigation_plan": f"Mitigation plan: {random.choice(RISK_MITIGATIONS)}",
+                    "mitigation_owner_emp_id": employee_ids[owner_index] if owner_index is not None else None,
+                    "identified_date": today - timedelta(days=random.randint(1, 30)),
+                    "target_resolution_date": today + timedelta(days=random.randint(30, 90)),
+                    "status": random.choice(RISK_STATUSES)
+                })
+        bulk_insert(session, RiskRegister, risk_rows)
         
         # Create priority scores for all employees
         print("\nCreating priority scores...")
+        # Base rate (one card per employee) and highest domain-specific rate, aggregated in SQL
+        base_rate_by_emp = dict(session.execute(
+            select(RateCard.emp_id, func.min(RateCard.hourly_rate))
+            .where(RateCard.rate_type == RateType.BASE)
+            .group_by(RateCard.emp_id)
+        ).all())
+        max_domain_rate_by_emp = dict(session.execute(
+            select(RateCard.emp_id, func.max(RateCard.hourly_rate))
+            .where(RateCard.rate_type == RateType.DOMAIN_SPECIFIC)
+            .group_by(RateCard.emp_id)
+        ).all())
+        
+        priority_rows = []
         for employee in employees:
-            # Get base rate card
-            base_rate_card = session.query(RateCard).filter(
-                RateCard.emp_id == employee.id,
-                RateCard.rate_type == RateType.BASE
-            ).first()
-            
-            base_rate_value = base_rate_card.hourly_rate if base_rate_card else 0
-            
-            # Get max domain rate
-            domain_rates = session.query(RateCard).filter(
-                RateCard.emp_id == employee.id,
-                RateCard.rate_type == RateType.DOMAIN_SPECIFIC
-            ).all()
-            max_domain_rate = max([r.hourly_rate for r in domain_rates]) if domain_rates else base_rate_value
+            base_rate_value = base_rate_by_emp.get(employee.id, 0)
+            max_domain_rate = max_domain_rate_by_emp.get(employee.id, base_rate_value)
             
             # Calculate days on bench
-            last_allocation = session.query(Allocation).filter(
-                Allocation.emp_id == employee.id
-            ).order_by(Allocation.end_date.desc()).first()
-            
             days_on_bench = 0
             last_allocation_end = None
             if employee.status == EmployeeStatus.BENCH:
-                if last_allocation and last_allocation.end_date:
-                    days_on_bench = (date.today() - last_allocation.end_date).days
-                    last_allocation_end = last_allocation.end_date
+                if last_allocation_end_by_emp.get(employee.id):
+                    last_allocation_end = last_allocation_end_by_emp[employee.id]
+                    days_on_bench = (today - last_allocation_end).days
                 else:
                     days_on_bench = random.randint(1, 60)
             
@@ -649,44 +886,45 @@ def seed_database():
             priority_score = (max_domain_rate * 0.7) + (base_rate_value * 0.3) + (days_on_bench * 0.5)
             
             # Determine priority tier
-            if priority_score >= 150:
-                tier = PriorityTier.CRITICAL
-            elif priority_score >= 100:
-                tier = PriorityTier.HIGH
-            elif priority_score >= 50:
-                tier = PriorityTier.MEDIUM
-            else:
-                tier = PriorityTier.LOW
-            
-            priority = PriorityScoring(
-                emp_id=employee.id,
-                priority_score=round(priority_score, 2),
-                base_rate_card_value=round(base_rate_value, 2),
-                max_domain_rate_value=round(max_domain_rate, 2),
-                days_on_bench=days_on_bench,
-                last_allocation_end_date=last_allocation_end,
-                priority_tier=tier
-            )
-            session.add(priority)
+            tier = PRIORITY_TIERS[bisect_right(PRIORITY_TIER_THRESHOLDS, priority_score)]
+            
+            priority_rows.append({
+                "emp_id": employee.id,
+                "priority_score": round(priority_score, 2),
+                "base_rate_card_value": base_rate_value,  # Rate cards are stored rounded to 2 places
+                "max_domain_rate_value": max_domain_rate,
+                "days_on_bench": days_on_bench,
+                "last_allocation_end_date": last_allocation_end,
+                "priority_tier": tier
+            })
+        
+        raw_insert(session, PriorityScoring, priority_rows)
         
+        # Wait for the embeddings before committing so an embedding failure rolls the
+        # seed back, then write them to ChromaDB only once the SQL data is committed
+        embeddings = embedding_future.result() if embedding_future else None
         session.commit()
-        print("\nSUCCESS: Database seeded successfully!")
-        print(f"   - {len(employees)} employees created")
-        print(f"   - {len(projects)} projects created")
-        print(f"   - {len(domains)} domains created")
-        print(f"   - Employee domains assigned")
-        print(f"   - Project domains assigned")
-        print(f"   - Rate cards created")
-        print(f"   - Allocations created")
-        print(f"   - Allocation financials created")
-        print(f"   - Project role requirements created")
-        print(f"   - Project rate requirements created")
-        print(f"   - Feedback entries created")
-        print(f"   - Bench ledger entries created")
-        print(f"   - Financial metrics created")
-        print(f"   - Risk register entries created")
-        print(f"   - Priority scores calculated")
-        print(f"   - ChromaDB embeddings generated")
+        if embeddings:
+            vector_tool.upsert_employee_embeddings(*embeddings)
+        print("\n".join([
+            "\nSUCCESS: Database seeded successfully!",
+            f"   - {len(employees)} employees created",
+            f"   - {len(projects)} projects created",
+            f"   - {len(domains)} domains created",
+            "   - Employee domains assigned",
+            "   - Project domains assigned",
+            "   - Rate cards created",
+            "   - Allocations created",
+            "   - Allocation financials created",
+            "   - Project role requirements created",
+            "   - Project rate requirements created",
+            "   - Feedback entries created",
+            "   - Bench ledger entries created",
+            "   - Financial metrics created",
+            "   - Risk register entries created",
+            "   - Priority scores calculated",
+            "   - ChromaDB embeddings generated" if embedding_future else "   - ChromaDB embeddings skipped (CHROMA_SEED=0)",
+        ]))
         
     except Exception as e:
         session.rollback()
@@ -694,6 +932,9 @@ def seed_database():
         raise
     finally:
         session.close()
+        connection.close()
+        # After a failure the embeddings are never written, so drop a job that hasn't started
+        embedding_executor.shutdown(cancel_futures=True)
 
 if __name__ == '__main__':
     seed_database()
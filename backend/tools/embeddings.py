@@ -2,15 +2,27 @@
 Gemini Embedding Tool for BenchCraft AI
 Extracts structured fields from resume text using Gemini LLM API (stub)
 """
+import copy
+from functools import lru_cache
+
+# Resumes are often re-uploaded or re-parsed; cache extractions so identical text
+# does not repeat the (eventual) Gemini round-trip
+EXTRACT_CACHE_SIZE = 256
+
+@lru_cache(maxsize=EXTRACT_CACHE_SIZE)
+def _extract_fields(text):
+    # Stub: Replace with Gemini API call
+    # For now, return mock structured data
+    return {
+        'name': 'John Doe',
+        'email': 'john.doe@example.com',
+        'phone': '+1234567890',
+        'experience': '5 years',
+        'skills': ['Python', 'SQL', 'AI'],
+        'education': 'B.Tech Computer Science'
+    }
+
 class GeminiEmbeddingTool:
     def extract_fields(self, text):
-        # Stub: Replace with Gemini API call
-        # For now, return mock structured data
-        return {
-            'name': 'John Doe',
-            'email': 'john.doe@example.com',
-            'phone': '+1234567890',
-            'experience': '5 years',
-            'skills': ['Python', 'SQL', 'AI'],
-            'education': 'B.Tech Computer Science'
-        }
+        # Copy so callers can't mutate the cached result
+        return copy.deepcopy(_extract_fields(text))
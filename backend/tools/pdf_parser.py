@@ -1,14 +1,19 @@
 """
 PDF Parser Tool for BenchCraft AI
-Extracts text from PDF files using PyPDF2
+Extracts text from PDF files using PyMuPDF when installed, otherwise PyPDF2
 """
 import PyPDF2
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
 
 class PDFParserTool:
     def parse(self, pdf_path):
+        if pymupdf is not None:
+            # Native extractor, much faster than PyPDF2 on long resumes
+            with pymupdf.open(pdf_path) as doc:
+                return "".join(page.get_text() for page in doc)
         with open(pdf_path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() or ""
-        return text
+            return "".join(page.extract_text() or "" for page in reader.pages)
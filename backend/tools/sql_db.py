@@ -3,7 +3,7 @@ SQLite Database Interface Tools - BenchCraft AI
 Corrected with Eager Loading to prevent DetachedInstanceErrors
 """
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, selectinload
+from sqlalchemy.orm import sessionmaker, selectinload, raiseload
 from models import Base, Employee, Project, Allocation, EmployeeSkill, EmployeeStatus, ProjectStatus
 from config import Config
 from typing import List, Dict, Optional
@@ -24,7 +24,20 @@ class SQLDatabaseTool:
         session = self.Session()
         try:
             return session.query(Employee).options(
-                selectinload(Employee.skills)
+                selectinload(Employee.skills),
+                raiseload('*')
+            ).filter(Employee.id == emp_id).first()
+        finally:
+            session.close()
+    
+    def get_employee_with_project_history(self, emp_id: int) -> Optional[Employee]:
+        """Get employee by ID with skills, allocations and their projects eagerly loaded"""
+        session = self.Session()
+        try:
+            return session.query(Employee).options(
+                selectinload(Employee.skills),
+                selectinload(Employee.allocations).selectinload(Allocation.project),
+                raiseload('*')
             ).filter(Employee.id == emp_id).first()
         finally:
             session.close()
@@ -36,7 +49,8 @@ class SQLDatabaseTool:
             # selectinload fixes the DetachedInstanceError by fetching skills 
             # before the session is closed.
             return session.query(Employee).options(
-                selectinload(Employee.skills)
+                selectinload(Employee.skills),
+                raiseload('*')
             ).filter(Employee.id.in_(emp_ids)).all()
         finally:
             session.close()
@@ -46,7 +60,8 @@ class SQLDatabaseTool:
         session = self.Session()
         try:
             return session.query(Employee).options(
-                selectinload(Employee.skills)
+                selectinload(Employee.skills),
+                raiseload('*')
             ).filter(
                 Employee.status == EmployeeStatus.BENCH
             ).all()
@@ -3,11 +3,23 @@ ChromaDB Interface for Vector Search
 """
 import chromadb
 from chromadb.config import Settings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict
 import google.genai as genai
 from config import Config
 
+EMBEDDING_MODEL = "models/text-embedding-004"
+# Gemini accepts at most 100 texts per batch embedding request
+EMBEDDING_BATCH_SIZE = 100
+# Concurrent Gemini batch requests; kept small to stay within API rate limits
+EMBEDDING_WORKERS = 4
+# Records per Chroma upsert, each written in a single transaction
+CHROMA_BATCH_SIZE = 1000
+# Distinct (text, task_type) embeddings kept per tool instance; repeated searches skip Gemini
+EMBEDDING_CACHE_SIZE = 1024
+
 class ChromaSearchTool:
     """Tool for semantic search in ChromaDB"""
     
@@ -21,26 +33,82 @@ class ChromaSearchTool:
         )
         # Configure Gemini API
         self.client_genai = genai.Client(api_key=Config.GEMINI_API_KEY)
+        self._cached_embedding = lru_cache(maxsize=EMBEDDING_CACHE_SIZE)(self._embed)
     
-    def get_embedding(self, text: str, task_type: str = "retrieval_document") -> List[float]:
-        """Generate embedding for text using Gemini"""
+    def _embed(self, text: str, task_type: str) -> tuple:
         result = self.client_genai.models.embed_content(
-            model="models/text-embedding-004",
+            model=EMBEDDING_MODEL,
             contents=text,
             config={"task_type": task_type}
         )
         # Handle the response structure of the new SDK
-        return result.embeddings[0].values
+        return tuple(result.embeddings[0].values)
     
-    def add_employee_embedding(self, emp_id: int, bio: str):
-        """Add employee bio to vector store"""
-        embedding = self.get_embedding(bio)
-        self.collection.add(
-            ids=[f"emp_{emp_id}"],
-            embeddings=[embedding],
-            documents=[bio],
-            metadatas=[{"emp_id": emp_id}]
+    def get_embedding(self, text: str, task_type: str = "retrieval_document") -> List[float]:
+        """Generate embedding for text using Gemini, cached per (text, task_type)"""
+        return list(self._cached_embedding(text, task_type))
+    
+    def _embed_batch(self, texts: List[str], task_type: str) -> List[List[float]]:
+        result = self.client_genai.models.embed_content(
+            model=EMBEDDING_MODEL,
+            contents=texts,
+            config={"task_type": task_type}
         )
+        return [embedding.values for embedding in result.embeddings]
+    
+    def get_embeddings(self, texts: List[str], task_type: str = "retrieval_document") -> List[List[float]]:
+        """
+        Generate embeddings for many texts, one Gemini call per EMBEDDING_BATCH_SIZE
+        texts, with up to EMBEDDING_WORKERS calls in flight at once
+        """
+        batches = [texts[start:start + EMBEDDING_BATCH_SIZE] for start in range(0, len(texts), EMBEDDING_BATCH_SIZE)]
+        if len(batches) <= 1:
+            return self._embed_batch(batches[0], task_type) if batches else []
+        
+        embeddings = []
+        with ThreadPoolExecutor(max_workers=min(EMBEDDING_WORKERS, len(batches))) as executor:
+            # map() yields results in batch order, keeping embeddings aligned with texts
+            for batch_embeddings in executor.map(lambda batch: self._embed_batch(batch, task_type), batches):
+                embeddings.extend(batch_embeddings)
+        return embeddings
+    
+    def add_employee_embedding(self, emp_id: int, bio: str):
+        """Add or update a single employee bio in the vector store"""
+        self.add_employee_embeddings_bulk([emp_id], [bio])
+    
+    def add_employee_embeddings_bulk(self, emp_ids: List[int], bios: List[str]):
+        """
+        Add or update many employee bios with batched embedding calls and one
+        upsert per CHROMA_BATCH_SIZE records. Bios already stored with identical
+        text are skipped, so re-seeding does not re-embed or re-index unchanged
+        employees.
+        """
+        emp_ids, bios = self.get_changed_bios(emp_ids, bios)
+        self.upsert_employee_embeddings(emp_ids, bios, self.get_embeddings(bios))
+    
+    def get_changed_bios(self, emp_ids: List[int], bios: List[str]):
+        """Return the (emp_ids, bios) whose text differs from what is already stored"""
+        if not emp_ids:
+            return [], []
+        existing = self.collection.get(ids=[f"emp_{emp_id}" for emp_id in emp_ids], include=["documents"])
+        stored_docs = dict(zip(existing['ids'], existing['documents']))
+        changed = [
+            (emp_id, bio)
+            for emp_id, bio in zip(emp_ids, bios)
+            if stored_docs.get(f"emp_{emp_id}") != bio
+        ]
+        return [emp_id for emp_id, _ in changed], [bio for _, bio in changed]
+    
+    def upsert_employee_embeddings(self, emp_ids: List[int], bios: List[str], embeddings: List[List[float]]):
+        """Write precomputed bio embeddings, one upsert per CHROMA_BATCH_SIZE records"""
+        for start in range(0, len(emp_ids), CHROMA_BATCH_SIZE):
+            end = start + CHROMA_BATCH_SIZE
+            self.collection.upsert(
+                ids=[f"emp_{emp_id}" for emp_id in emp_ids[start:end]],
+                embeddings=embeddings[start:end],
+                documents=bios[start:end],
+                metadatas=[{"emp_id": emp_id} for emp_id in emp_ids[start:end]]
+            )
     
     def search(self, query: str, top_k: int = 10) -> List[Dict]:
         """
@@ -53,15 +121,23 @@ class ChromaSearchTool:
             n_results=top_k
         )
         
-        matches = []
-        if results['ids'] and len(results['ids'][0]) > 0:
-            for i, emp_id_str in enumerate(results['ids'][0]):
-                emp_id = int(emp_id_str.replace('emp_', ''))
-                distance = results['distances'][0][i] if results['distances'] else 0
-                matches.append({
-                    'emp_id': emp_id,
-                    'distance': distance,
-                    'match_score': 1 - distance  # Convert distance to similarity
-                })
-        
-        return matches
\ No newline at end of file
+        ids = results['ids'][0] if results['ids'] else []
+        distances = results['distances'][0] if results['distances'] else [0] * len(ids)
+        return [
+            {
+                'emp_id': int(doc_id[4:]),  # Strip the "emp_" prefix
+                'distance': distance,
+                'match_score': 1 - distance  # Convert distance to similarity
+            }
+            for doc_id, distance in zip(ids, distances)
+        ]
+
+# Shared instance so the Chroma and Gemini clients are created once per process
+_vector_tool = None
+
+def get_vector_tool() -> ChromaSearchTool:
+    """Return the process-wide ChromaSearchTool, creating it on first use"""
+    global _vector_tool
+    if _vector_tool is None:
+        _vector_tool = ChromaSearchTool()
+    return _vector_tool
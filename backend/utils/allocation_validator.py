@@ -2,7 +2,9 @@
 Allocation Validation Utilities
 Validates that employee allocations don't exceed 100% total allocation
 """
-from datetime import date
+import traceback
+from sqlalchemy import func, or_
+from sqlalchemy.exc import SQLAlchemyError
 from models import Allocation, Employee
 
 
@@ -22,52 +24,33 @@ def validate_allocation_percentage(session, employee_id, internal_allocation_per
         (is_valid, error_message): Tuple of (bool, str or None)
     """
     try:
-        # Get all active allocations for this employee that overlap with the date range
-        today = date.today()
+        # If new internal allocation percentage is 0%, it doesn't count towards total allocation
+        # (0% means not allocated, so it's always valid)
+        if internal_allocation_percentage == 0:
+            return True, None
         
-        # Build query for overlapping allocations
-        query = session.query(Allocation).filter(
-            Allocation.emp_id == employee_id
+        # Sum internal_allocation_percentage over overlapping allocations in SQL,
+        # falling back to allocation_percentage, then utilization, then 100%
+        query = session.query(
+            func.coalesce(func.sum(func.coalesce(
+                Allocation.internal_allocation_percentage,
+                Allocation.allocation_percentage,
+                Allocation.utilization,
+                100
+            )), 0)
+        ).filter(
+            Allocation.emp_id == employee_id,
+            # Two date ranges overlap if: start1 <= end2 AND start2 <= end1 (None end means ongoing)
+            or_(Allocation.end_date.is_(None), Allocation.end_date >= start_date)
         )
+        if end_date:
+            query = query.filter(Allocation.start_date <= end_date)
         
         # Exclude the allocation being updated
         if exclude_allocation_id:
             query = query.filter(Allocation.id != exclude_allocation_id)
         
-        # Find allocations that overlap with the new date range
-        # Two date ranges overlap if: start1 <= end2 AND start2 <= end1
-        overlapping_allocations = []
-        for alloc in query.all():
-            # Check if dates overlap
-            alloc_start = alloc.start_date
-            alloc_end = alloc.end_date if alloc.end_date else date(2099, 12, 31)  # Treat None as far future
-            new_end = end_date if end_date else date(2099, 12, 31)  # Treat None as far future
-            
-            # Check overlap: alloc_start <= new_end AND start_date <= alloc_end
-            if alloc_start <= new_end and start_date <= alloc_end:
-                overlapping_allocations.append(alloc)
-        
-        # Sum up internal_allocation_percentage from overlapping allocations
-        total_allocation = 0
-        for alloc in overlapping_allocations:
-            try:
-                # Try to get internal_allocation_percentage (primary field for validation)
-                alloc_pct = getattr(alloc, 'internal_allocation_percentage', None)
-                if alloc_pct is None:
-                    # Fallback to allocation_percentage if internal_allocation_percentage doesn't exist
-                    alloc_pct = getattr(alloc, 'allocation_percentage', None)
-                    if alloc_pct is None:
-                        # Fallback to utilization if allocation_percentage doesn't exist
-                        alloc_pct = getattr(alloc, 'utilization', 100) or 100
-                total_allocation += alloc_pct
-            except (AttributeError, TypeError):
-                # If field doesn't exist, assume 100%
-                total_allocation += 100
-        
-        # If new internal allocation percentage is 0%, it doesn't count towards total allocation
-        # (0% means not allocated, so it's always valid)
-        if internal_allocation_percentage == 0:
-            return True, None
+        total_allocation = query.scalar()
         
         # Add the new internal allocation percentage
         total_allocation += internal_allocation_percentage
@@ -81,9 +64,8 @@ def validate_allocation_percentage(session, employee_id, internal_allocation_per
         
         return True, None
     
-    except Exception as e:
-        # If there's an error, log it but allow the allocation (fail open for now)
-        import traceback
+    except SQLAlchemyError as e:
+        # If the database query fails, log it but allow the allocation (fail open for now)
         print(f"Warning: Error validating allocation percentage: {e}")
-        print(traceback.format_exc())
+        traceback.print_exc()
         return True, None